@@ -25,3 +25,4 @@ class Config:
     
     # Storage Settings
     CHAT_STORAGE_DIR: str = "Chat_Logs"
+    CHAT_COMPACT_EVERY: int = 100  # Logged events between full conversation snapshots
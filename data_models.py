@@ -4,6 +4,7 @@ All Pydantic models are defined here.
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, Field
 import uuid
@@ -21,6 +22,11 @@ class TimelineEvent(BaseModel):
         description="When this event occurred"
     )
 
+    @cached_property
+    def iso_timestamp(self) -> str:
+        """ISO 8601 form of the timestamp, formatted once per event."""
+        return self.timestamp.isoformat()
+
 
 class Message(TimelineEvent):
     """Represents a single message in the conversation."""
@@ -3,5 +3,6 @@ Helper utilities for the RoleRealm system.
 """
 
 from .response_parser import parse_json_response
+from .json_codec import dumps, dumps_line, loads, load_file, JSONDecodeError
 
-__all__ = ['parse_json_response']
\ No newline at end of file
+__all__ = ['parse_json_response', 'dumps', 'dumps_line', 'loads', 'load_file', 'JSONDecodeError']
\ No newline at end of file
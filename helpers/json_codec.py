@@ -0,0 +1,93 @@
+"""
+Fast JSON encoding/decoding with graceful fallbacks.
+
+Prefers orjson, falls back to ujson, then to the standard library json
+module so the system still runs on platforms without the faster wheels.
+"""
+
+import mmap
+import os
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (2-space indent if requested)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize obj to one compact line of JSON bytes, newline included."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    loads = orjson.loads
+
+    def _loads_mapped(buf: mmap.mmap) -> Any:
+        """Parse a memory-mapped JSON document without copying it."""
+        with memoryview(buf) as view:
+            return orjson.loads(view)
+
+except ImportError:
+    def _default(obj: Any) -> Any:
+        """Serialize datetimes the way orjson does (ISO 8601)."""
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    try:
+        import ujson
+
+        JSONDecodeError = ujson.JSONDecodeError
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes (2-space indent if requested)."""
+            return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=False, default=_default).encode('utf-8')
+
+        def dumps_line(obj: Any) -> bytes:
+            """Serialize obj to one compact line of JSON bytes, newline included."""
+            return dumps(obj) + b"\n"
+
+        loads = ujson.loads
+
+        def _loads_mapped(buf: mmap.mmap) -> Any:
+            """Parse a memory-mapped JSON document."""
+            return ujson.loads(buf[:])
+
+    except ImportError:
+        import json
+
+        JSONDecodeError = json.JSONDecodeError
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            """Serialize obj to UTF-8 JSON bytes (2-space indent if requested)."""
+            return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default).encode('utf-8')
+
+        def dumps_line(obj: Any) -> bytes:
+            """Serialize obj to one compact line of JSON bytes, newline included."""
+            return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8') + b"\n"
+
+        loads = json.loads
+
+        def _loads_mapped(buf: mmap.mmap) -> Any:
+            """Parse a memory-mapped JSON document."""
+            return json.loads(buf[:])
+
+
+def load_file(path: "os.PathLike[str] | str") -> Any:
+    """
+    Parse a JSON file by memory-mapping it instead of reading it into a string first.
+    
+    Args:
+        path: Path of the JSON file
+        
+    Returns:
+        The decoded JSON document
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return loads(b"")  # mmap can't map an empty file; raises JSONDecodeError
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _loads_mapped(buf)
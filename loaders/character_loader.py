@@ -3,11 +3,17 @@ Character loader module for loading character personas from JSON files.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from data_models import CharacterPersona
 
 
+# Parsed personas keyed by file path, with the (mtime_ns, size) they were parsed at.
+# An edited file no longer matches its signature and is parsed again.
+_CHARACTER_CACHE: Dict[str, Tuple[Tuple[int, int], CharacterPersona]] = {}
+
+
 class CharacterLoader:
     """Load character personas from JSON files."""
     
@@ -47,17 +53,28 @@ class CharacterLoader:
         filename = f"{character_name.lower()}.json"
         filepath = self.characters_dir / filename
         
-        if not filepath.exists():
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Character file not found: {filepath}\n"
                 f"Available characters: {self.list_available_characters()}"
             )
         
+        # Serve unchanged files from the cache; callers get their own copy since personas are mutable
+        key = str(filepath)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _CHARACTER_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1].model_copy(deep=True)
+        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 character_data = json.load(f)
             
-            return CharacterPersona(**character_data)
+            persona = CharacterPersona(**character_data)
+            _CHARACTER_CACHE[key] = (signature, persona)
+            return persona.model_copy(deep=True)
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {filepath}: {e}")
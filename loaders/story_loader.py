@@ -2,76 +2,214 @@
 Story loader module for loading story configurations from JSON files.
 """
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import uuid
+from typing import Any, Dict, List, Optional, Tuple
 from data_models import Story
+from helpers import json_codec
+
+try:
+    import fastjsonschema
+
+    # Story's JSON Schema compiled once into a specialized validator, so trusted loads
+    # still reject malformed story files without paying for Pydantic validation
+    _validate_story = fastjsonschema.compile(Story.model_json_schema())
+except ImportError:
+    _validate_story = None
+
+
+# Parsed stories keyed by file path, with the (mtime_ns, size) they were parsed at.
+# An edited file no longer matches its signature and is parsed again.
+_STORY_CACHE: Dict[str, Tuple[Tuple[int, int], Story]] = {}
+
+# Story files larger than this are memory-mapped instead of read into a bytes copy
+_MMAP_THRESHOLD = 256 * 1024
+
+# Shared pool for parallel and background story loads (threads are only started on first use)
+_LOAD_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="story-loader")
+
+
+def _read_story_data(filepath: str, size: int) -> Dict[str, Any]:
+    """Parse a story file, memory-mapping it when it is large."""
+    if size > _MMAP_THRESHOLD:
+        return json_codec.load_file(filepath)
+    with open(filepath, 'rb') as f:
+        return json_codec.loads(f.read())
 
 
 class StoryLoader:
     """Load story configurations from JSON files."""
     
-    def __init__(self, base_dir: str):
+    def __init__(self, base_dir: str, trust_schema: bool = True):
         """
         Initialize the story loader.
         
         Args:
             base_dir: Base story directory (e.g., 'D:\RoleRealm\Pirate Adventure')
             The loader will automatically look in the 'story' subdirectory
+            trust_schema: Build stories that pass the compiled Story schema without Pydantic
+                          validation; files the schema rejects, or every file when fastjsonschema
+                          is not installed, are still fully validated by Pydantic
+                          (set False to always fully validate story files while authoring them)
         """
         if not base_dir:
             raise ValueError("base_dir is required and cannot be None or empty")
         self.base_dir = Path(base_dir)
-        if not self.base_dir.exists():
-            raise ValueError(f"Story base directory not found: {self.base_dir}")
+        self.trust_schema = trust_schema
         
         # Automatically append 'story' subdirectory
         self.stories_dir = self.base_dir / "story"
-        if not self.stories_dir.exists():
+        # One stat covers both directories; the base directory is only checked to explain a failure
+        if not self.stories_dir.is_dir():
+            if not self.base_dir.exists():
+                raise ValueError(f"Story base directory not found: {self.base_dir}")
             raise ValueError(f"Story directory not found: {self.stories_dir}")
+        # Story file paths are built and opened as plain strings
+        self._dir_str = str(self.stories_dir)
     
-    def load_story(self) -> Story:
+    def _find_story_file(self) -> str:
         """
-        Load the story from the single JSON file in the story directory.
+        Find the single JSON story file in the story directory.
         
         Returns:
-            Story instance
+            Path of the story file
             
         Raises:
-            FileNotFoundError: If no story file found or multiple story files found
-            ValueError: If JSON is invalid or missing required fields
+            FileNotFoundError: If no story file found
+            ValueError: If multiple story files found
         """
-        # Find all JSON files in the story directory
-        story_files = list(self.stories_dir.glob("*.json"))
+        story_names = self.list_available_stories()
         
-        if len(story_files) == 0:
+        if len(story_names) == 0:
             raise FileNotFoundError(f"No story file found in: {self.stories_dir}")
-        elif len(story_files) > 1:
+        elif len(story_names) > 1:
             raise ValueError(
                 f"Multiple story files found in {self.stories_dir}. "
-                f"Only one story file is allowed: {[f.name for f in story_files]}"
+                f"Only one story file is allowed: {[f'{name}.json' for name in story_names]}"
             )
         
-        filepath = story_files[0]
+        return os.path.join(self._dir_str, f"{story_names[0]}.json")
+    
+    def list_available_stories(self) -> List[str]:
+        """
+        List all available story JSON files.
+        
+        Returns:
+            List of story names (without .json extension)
+        """
+        # scandir yields plain names, so no Path object is built per directory entry
+        with os.scandir(self._dir_str) as entries:
+            return [entry.name[:-5] for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+    
+    def _cache_lookup(self, filepath: str) -> Tuple[Tuple[int, int], Optional[Story]]:
+        """
+        Stat the story file once and look it up in the parsed story cache.
         
+        Args:
+            filepath: Path of the story file
+            
+        Returns:
+            Tuple of (file signature, cached Story or None if missing or stale)
+            
+        Raises:
+            FileNotFoundError: If the story file disappeared since it was listed
+        """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                story_data = json.load(f)
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Story file not found: {filepath}")
+        
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _STORY_CACHE.get(filepath)
+        if cached is not None and cached[0] == signature:
+            return signature, cached[1]
+        return signature, None
+    
+    def load_story(self) -> Story:
+        """
+        Load the story from the single JSON file in the story directory.
+        
+        Returns:
+            Story instance
+            
+        Raises:
+            FileNotFoundError: If no story file found or multiple story files found
+            ValueError: If JSON is invalid or missing required fields
+        """
+        filepath = self._find_story_file()
+        
+        # Serve unchanged files from the cache; callers get their own copy since story progress is mutable.
+        # Validating loaders always re-parse so authoring errors still surface.
+        signature, cached = self._cache_lookup(filepath)
+        if cached is not None and self.trust_schema:
+            return cached.model_copy(deep=True)
+        
+        try:
+            story_data = _read_story_data(filepath, signature[1])
             
             # No beat processing needed - just load the story with objectives
             # Ensure current_objective_index exists
-            if "current_objective_index" not in story_data:
-                story_data["current_objective_index"] = 0
+            story_data.setdefault("current_objective_index", 0)
             
-            # Create and return Story
-            return Story(**story_data)
+            # Create, cache and return Story
+            story = None
+            if self.trust_schema and _validate_story is not None:
+                try:
+                    _validate_story(story_data)
+                    story = Story.model_construct(**story_data)
+                except fastjsonschema.JsonSchemaException:
+                    # The schema is stricter than Pydantic (e.g. "3" for an int field),
+                    # so let full validation coerce the value or report the real error
+                    pass
+            if story is None:
+                story = Story(**story_data)
+            _STORY_CACHE[filepath] = (signature, story)
+            return story.model_copy(deep=True)
             
-        except json.JSONDecodeError as e:
+        except json_codec.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {filepath}: {e}")
         except Exception as e:
             raise ValueError(f"Error loading story from {filepath}: {e}")
 
+    
+    def get_story_info(self) -> Dict[str, Any]:
+        """
+        Get summary information about the story without building a Story.
+        
+        Returns:
+            Dictionary with 'title', 'description' and 'num_objectives'
+            
+        Raises:
+            FileNotFoundError: If no story file found
+            ValueError: If multiple story files found or JSON is invalid
+        """
+        filepath = self._find_story_file()
+        
+        # Reuse an already parsed story when the file hasn't changed
+        signature, story = self._cache_lookup(filepath)
+        if story is not None:
+            return {
+                "title": story.title,
+                "description": story.description,
+                "num_objectives": len(story.objectives)
+            }
+        
+        # Otherwise only the top-level keys are read; no model validation needed
+        try:
+            story_data = _read_story_data(filepath, signature[1])
+        except json_codec.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {filepath}: {e}")
+        
+        return {
+            "title": story_data.get("title"),
+            "description": story_data.get("description"),
+            "num_objectives": len(story_data.get("objectives") or [])
+        }
 
+
+    @staticmethod
     def get_story_file_name(base_dir: str) -> str:
         """
         Get the name of the story file in the directory.
@@ -86,15 +224,56 @@ class StoryLoader:
             FileNotFoundError: If no story file found
             ValueError: If multiple story files found
         """
-        story_dir = Path(base_dir) / "story"
-        story_files = list(story_dir.glob("*.json"))
+        return os.path.basename(get_story_loader(base_dir)._find_story_file())
+
+
+@lru_cache(maxsize=16)
+def get_story_loader(base_dir: str) -> StoryLoader:
+    """
+    Get a shared StoryLoader for a story directory.
+    
+    Loaders are reused so repeated loads skip the directory checks in StoryLoader.__init__.
+    
+    Args:
+        base_dir: Base story directory (e.g., 'Pirate Adventure')
         
-        if len(story_files) == 0:
-            raise FileNotFoundError(f"No story file found in: {story_dir}")
-        elif len(story_files) > 1:
-            raise ValueError(
-                f"Multiple story files found in {story_dir}. "
-                f"Only one story file is allowed: {[f.name for f in story_files]}"
-            )
+    Returns:
+        StoryLoader instance for base_dir
+    """
+    return StoryLoader(base_dir)
+
+
+def _load_story_for(base_dir: str) -> Story:
+    """Load the story of a story directory through its shared loader."""
+    return get_story_loader(base_dir).load_story()
+
+
+def load_stories(base_dirs: List[str]) -> Dict[str, Story]:
+    """
+    Load the stories of several story directories in parallel.
+    
+    File reads overlap on the shared loader pool, which helps most on slow or network-mounted disks.
+    
+    Args:
+        base_dirs: Base story directories (e.g., ['Pirate Adventure', ...])
+        
+    Returns:
+        Dictionary mapping each base directory to its Story
         
-        return story_files[0].name
\ No newline at end of file
+    Raises:
+        ValueError / FileNotFoundError: From the first story that fails to load
+    """
+    return dict(zip(base_dirs, _LOAD_POOL.map(_load_story_for, base_dirs)))
+
+
+def preload(base_dirs: List[str]) -> None:
+    """
+    Start loading stories in the background so later loads are served from the cache.
+    
+    Failures are ignored here; they surface again when the story is actually loaded.
+    
+    Args:
+        base_dirs: Base story directories to warm up
+    """
+    for base_dir in base_dirs:
+        _LOAD_POOL.submit(_load_story_for, base_dir)
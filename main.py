@@ -9,7 +9,7 @@ from roleplay_system import RoleplaySystem
 from config import Config
 from managers.storyManager import StoryManager
 from loaders.character_loader import CharacterLoader
-from loaders.story_loader import StoryLoader
+from loaders.story_loader import get_story_loader
 from data_models import Message, Scene, Action, CharacterEntry, CharacterExit
 
 # Initialize colorama for Windows color support
@@ -82,8 +82,7 @@ def main():
     # Load story from JSON
     print("\n📖 Loading Story...")
     try:
-        story_loader = StoryLoader(BASE_DIR)
-        story_arc = story_loader.load_story()
+        story_arc = get_story_loader(BASE_DIR).load_story()
         print(f"   ✓ Loaded: {story_arc.title}\n")
     except Exception as e:
         print(f"❌ Error loading story: {e}")
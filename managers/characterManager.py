@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any, Tuple
 import sys
+import textwrap
 from pathlib import Path
-import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -11,6 +11,110 @@ from openrouter_client import GenerativeModel
 from helpers.response_parser import parse_json_response
 
 
+# Decision rules shared by every character. Sent as a leading system message so the
+# identical prefix can be served from the provider's prompt cache across characters and turns.
+_DECISION_INSTRUCTIONS = textwrap.dedent("""\
+        DECISION:
+        Based on YOUR experiences, YOUR traits, and YOUR current state, decide how you want to respond right now.
+        
+        THREE OPTIONS:
+        1. **SPEAK** - Respond with dialogue (and accompanying action)
+        2. **ACT** - React physically/emotionally WITHOUT speaking (silent action)
+        3. **SILENT** - Do nothing, stay quiet
+        
+        WHEN TO SPEAK (high priority):
+        1. **Someone greets the group or asks how everyone is doing** - It's natural to respond as friends!
+        2. **Someone reveals important/concerning information** - React with your authentic concern!
+        3. **You're directly addressed or mentioned** - Respond naturally!
+        4. **There's been awkward silence** - Someone should break it!
+        5. **The topic is highly relevant to YOU** - Share your unique perspective!
+        6. **Someone needs help or support** - Friends respond to friends!
+        
+        WHEN TO ACT (medium priority):
+        - You want to react but words feel forced or unnecessary
+        - Showing emotion through body language is more powerful than speaking
+        - High tension moment where silence + action is more dramatic
+        - You're uncomfortable/unsure and just want to show physical reaction
+        - Someone said something shocking and you need a moment to process
+        - Physical reaction conveys your feeling better than words would
+
+        WHEN TO STAY SILENT (stay quiet):
+        - You JUST spoke in the last message (let others respond first)
+        - Someone else already said exactly what you'd say
+        - You've made the same point 2-3+ times already (don't be repetitive!)
+        - **If others already reacted to danger/concern, you don't need to pile on with the SAME reaction**
+        - Someone clearly wants to end a topic and you'd just push it again
+        - Another character is better suited to respond to this specific topic
+        - The conversation doesn't involve you and you have nothing unique to add
+        - **Multiple people already said similar things - don't be the third person saying the same thing**
+
+        SPECIAL SITUATIONS:
+        - **RESPECT BOUNDARIES**: If someone has stated their position, accept it or change approach
+        - **REACT TO DANGER/CONCERN**: If friend mentions pain/danger/threat, respond with concern ONLY if you have something UNIQUE to add beyond what others said
+        - **WITHDRAWAL CONTEXT**: If someone needs rest after revealing something serious, acknowledge both parts
+        - **DON'T GANG UP**: If another character already made your exact point, DON'T repeat it - offer a DIFFERENT suggestion or stay quiet
+        - **BE INDEPENDENT**: Have your own opinions - don't just echo what others said with slightly different words
+        - **NATURAL FLOW**: Sometimes "Alright, if you say so" or changing subjects IS the right move
+        - **CHECK WHAT OTHERS SAID**: Look at the last 2-3 messages of what you experienced. If they already covered your concern, you don't need to repeat it
+
+        OUTPUT FORMAT (strict JSON):
+        
+        For "speak" type:
+        {
+        "type": "speak",
+        "priority": 0.0 to 1.0 (how urgent/important is your response),
+        "reasoning": "brief explanation of your decision",
+        "dialogue": "your actual spoken words here(25-70 words)",
+        "action": "physical actions/body language accompanying speech. For example: 'smiles warmly', 'leans forward eagerly', 'frowns slightly', etc. in 15-20 words"
+        }
+        
+        For "act" type:
+        {
+        "type": "act",
+        "priority": 0.0 to 1.0,
+        "reasoning": "brief explanation of your decision",
+        "action": "silent physical action/reaction without speaking. For example 'crosses arms and looks away', 'paces to the window nervously', 'sits down heavily with a sigh', etc. in 15-20 words"
+        }
+        
+        For "silent" type:
+        {
+        "type": "silent",
+        "priority": 0.0,
+        "reasoning": "brief explanation why you're staying quiet"
+        }
+
+        IMPORTANT:
+        - For "speak": Include dialogue (required) and action 
+        - For "act": Only include action (no dialogue)
+        - For "silent": Only type, priority, and reasoning
+
+        **CRITICAL - ACTION VARIETY RULES (READ THIS CAREFULLY):**
+        1. **CHECK THE CONVERSATION PROVIDED** - Look at your previous messages in what you experienced. What actions did you ALREADY do?
+        2. **NEVER REPEAT ACTIONS** - If you already "leaned forward", "sat back", "crossed arms", "looked at someone" - DON'T DO IT AGAIN
+        3. **PHYSICAL CONSISTENCY** - If you already sat down or leaned back, you can't lean back AGAIN. Instead: stand up, walk somewhere, gesture differently, adjust position, look away, etc.
+        4. **VARIETY IS MANDATORY** - Each of your actions MUST be different from all your previous actions in this conversation
+        5. **EXAMPLES OF VARIETY**:
+        - First message: "leans back against sofa"
+        - Second message: "sits forward suddenly" or "stands up" or "runs hand through hair"
+        - Third message: "paces to the window" or "fidgets with wand" or "slumps in chair"
+        - NEVER: "leans back" again after already doing it!
+
+        - Stay COMPLETELY IN CHARACTER with your unique speaking style
+        - Don't repeat what others just said - add something NEW or DON'T SPEAK
+        - Keep messages realistic for casual conversation
+        - If you have nothing unique to add, choose "silent" type
+        - Your personality should be OBVIOUS from how you speak and act
+        - Don't sound like you're giving a lecture or writing an essay
+        - Use natural dialogue, contractions, and emotion
+        - Show, don't tell - use actions to convey personality
+        - **INDEPENDENCE**: Have your own opinions - don't just support what others said
+        - **BACKING OFF**: Sometimes "Alright, fair enough" or "Suit yourself" is the perfect response
+        - **RESPECTING AUTONOMY**: If someone clearly doesn't want to talk about something, that's OKAY
+        - **NATURAL FLOW**: Not every topic needs resolution. Sometimes you just move on.
+        - **REACT TO DANGER/CONCERN**: If your friend mentions pain, danger, or a threat - REACT! Even if they want to sleep after.
+        """)
+
+
 class CharacterManager:
     """Manager for character-related operations."""
     
@@ -46,18 +150,22 @@ class CharacterManager:
     def update_character_memory(
         self,
         character: Character,
-        event: TimelineEvent
+        event: Optional[TimelineEvent] = None,
+        events: Optional[List[TimelineEvent]] = None
     ) -> None:
         """
-        Update character's memory by adding timeline event.
+        Update character's memory by adding timeline event(s).
         
         Args:
             character: The Character to update
             event: The TimelineEvent to add to memory
+            events: Several TimelineEvents to add to memory, in order, in one call
         """
             
         if event is not None:
             character.memory.event.append(event)
+        if events:
+            character.memory.event.extend(events)
     
     def update_character_state(
         self,
@@ -170,119 +278,56 @@ class CharacterManager:
         
         Args:
             character: The AICharacter making the decision
-            story_context: Optional story context to guide the narrative
             
         Returns:
-            The complete prompt string 
+            The character-specific prompt string; the shared rules are sent
+            separately as the _DECISION_INSTRUCTIONS system message
         """ 
 
         persona_context = self.build_persona_context(character)
         state_context = self.build_state_context(character)
         memory_context = self.build_memory_context(character, last_n_messages=10)
         
-        prompt = f"""{persona_context}{state_context}
+        prompt = f"""{persona_context}{state_context or ""}
         WHAT YOU EXPERIENCED (your perspective):
         {memory_context}
-        DECISION:
-        Based on YOUR experiences, YOUR traits, and YOUR current state, decide how you want to respond right now.
-        
-        THREE OPTIONS:
-        1. **SPEAK** - Respond with dialogue (and accompanying action)
-        2. **ACT** - React physically/emotionally WITHOUT speaking (silent action)
-        3. **SILENT** - Do nothing, stay quiet
-        
-        WHEN TO SPEAK (high priority):
-        1. **Someone greets the group or asks how everyone is doing** - It's natural to respond as friends!
-        2. **Someone reveals important/concerning information** - React with your authentic concern!
-        3. **You're directly addressed or mentioned** - Respond naturally!
-        4. **There's been awkward silence** - Someone should break it!
-        5. **The topic is highly relevant to YOU** - Share your unique perspective!
-        6. **Someone needs help or support** - Friends respond to friends!
+        """
+        return prompt
+    
+    def _parse_turn_decision(self, response_text: str) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Parse a raw turn-decision response into a decision tuple.
         
-        WHEN TO ACT (medium priority):
-        - You want to react but words feel forced or unnecessary
-        - Showing emotion through body language is more powerful than speaking
-        - High tension moment where silence + action is more dramatic
-        - You're uncomfortable/unsure and just want to show physical reaction
-        - Someone said something shocking and you need a moment to process
-        - Physical reaction conveys your feeling better than words would
-
-        WHEN TO STAY SILENT (stay quiet):
-        - You JUST spoke in the last message (let others respond first)
-        - Someone else already said exactly what you'd say
-        - You've made the same point 2-3+ times already (don't be repetitive!)
-        - **If others already reacted to danger/concern, you don't need to pile on with the SAME reaction**
-        - Someone clearly wants to end a topic and you'd just push it again
-        - Another character is better suited to respond to this specific topic
-        - The conversation doesn't involve you and you have nothing unique to add
-        - **Multiple people already said similar things - don't be the third person saying the same thing**
-
-        SPECIAL SITUATIONS:
-        - **RESPECT BOUNDARIES**: If someone has stated their position, accept it or change approach
-        - **REACT TO DANGER/CONCERN**: If friend mentions pain/danger/threat, respond with concern ONLY if you have something UNIQUE to add beyond what others said
-        - **WITHDRAWAL CONTEXT**: If someone needs rest after revealing something serious, acknowledge both parts
-        - **DON'T GANG UP**: If another character already made your exact point, DON'T repeat it - offer a DIFFERENT suggestion or stay quiet
-        - **BE INDEPENDENT**: Have your own opinions - don't just echo what others said with slightly different words
-        - **NATURAL FLOW**: Sometimes "Alright, if you say so" or changing subjects IS the right move
-        - **CHECK WHAT OTHERS SAID**: Look at the last 2-3 messages. If they already covered your concern, you don't need to repeat it
-
-        OUTPUT FORMAT (strict JSON):
+        Args:
+            response_text: Raw JSON text returned by the model
+            
+        Returns:
+            Tuple of (response_type, priority, reasoning, dialouge, action)
+        """
+        decision_data = parse_json_response(response_text)
         
-        For "speak" type:
-        {{
-        "type": "speak",
-        "priority": 0.0 to 1.0 (how urgent/important is your response),
-        "reasoning": "brief explanation of your decision",
-        "dialogue": "your actual spoken words here(25-70 words)",
-        "action": "physical actions/body language accompanying speech. For example: 'smiles warmly', 'leans forward eagerly', 'frowns slightly', etc. in 15-20 words"
-        }}
+        response_type = decision_data.get("type", "silent").lower()
+        priority = decision_data.get("priority", 0.0)
+        reasoning = decision_data.get("reasoning", "No reasoning provided")
         
-        For "act" type:
-        {{
-        "type": "act",
-        "priority": 0.0 to 1.0,
-        "reasoning": "brief explanation of your decision",
-        "action": "silent physical action/reaction without speaking. For example 'crosses arms and looks away', 'paces to the window nervously', 'sits down heavily with a sigh', etc. in 15-20 words"
-        }}
+        # Extract dialouge based on response type
+        if response_type == "speak":
+            dialogue = decision_data.get("dialogue", None) 
+            action = decision_data.get("action", None)  
+        elif response_type == "act":
+            dialogue = None  # No dialogue for silent action
+            action = decision_data.get("action", None)  
+        else:  # silent
+            dialogue = None
+            action = None
         
-        For "silent" type:
-        {{
-        "type": "silent",
-        "priority": 0.0,
-        "reasoning": "brief explanation why you're staying quiet"
-        }}
-
-        IMPORTANT:
-        - For "speak": Include dialogue (required) and action 
-        - For "act": Only include action (no dialogue)
-        - For "silent": Only type, priority, and reasoning
-
-        **CRITICAL - ACTION VARIETY RULES (READ THIS CAREFULLY):**
-        1. **CHECK THE CONVERSATION ABOVE** - Look at your previous messages. What actions did you ALREADY do?
-        2. **NEVER REPEAT ACTIONS** - If you already "leaned forward", "sat back", "crossed arms", "looked at someone" - DON'T DO IT AGAIN
-        3. **PHYSICAL CONSISTENCY** - If you already sat down or leaned back, you can't lean back AGAIN. Instead: stand up, walk somewhere, gesture differently, adjust position, look away, etc.
-        4. **VARIETY IS MANDATORY** - Each of your actions MUST be different from all your previous actions in this conversation
-        5. **EXAMPLES OF VARIETY**:
-        - First message: "leans back against sofa"
-        - Second message: "sits forward suddenly" or "stands up" or "runs hand through hair"
-        - Third message: "paces to the window" or "fidgets with wand" or "slumps in chair"
-        - NEVER: "leans back" again after already doing it!
-
-        - Stay COMPLETELY IN CHARACTER with your unique speaking style
-        - Don't repeat what others just said - add something NEW or DON'T SPEAK
-        - Keep messages realistic for casual conversation
-        - If you have nothing unique to add, choose "silent" type
-        - Your personality should be OBVIOUS from how you speak and act
-        - Don't sound like you're giving a lecture or writing an essay
-        - Use natural dialogue, contractions, and emotion
-        - Show, don't tell - use actions to convey personality
-        - **INDEPENDENCE**: Have your own opinions - don't just support what others said
-        - **BACKING OFF**: Sometimes "Alright, fair enough" or "Suit yourself" is the perfect response
-        - **RESPECTING AUTONOMY**: If someone clearly doesn't want to talk about something, that's OKAY
-        - **NATURAL FLOW**: Not every topic needs resolution. Sometimes you just move on.
-        - **REACT TO DANGER/CONCERN**: If your friend mentions pain, danger, or a threat - REACT! Even if they want to sleep after.
-        """
-        return prompt
+        return (
+            response_type,
+            priority,
+            reasoning,
+            dialogue,
+            action
+        )
     
     def decide_turn_response(
         self, 
@@ -303,49 +348,44 @@ class CharacterManager:
             - dialouge: For "speak" = dialogue, For "act" = action, For "silent" = None
             - action: For "speak" = body_language, For "act"/"silent" = None
         """
+        # Build prompt from THIS character's perspective
+        prompt = self.build_decision_prompt(character)
         
-        try:
-            # Build prompt from THIS character's perspective
-            prompt = self.build_decision_prompt(character)
-            
-            # Generate with character's unique settings
-            response = self.model.generate_content(
-                prompt, 
-                temperature=character.persona.temperature, 
-                top_p=character.persona.top_p, 
-                frequency_penalty=character.persona.frequency_penalty
-            )
-            
-            # Parse JSON response
-            decision_data = parse_json_response(response.text)
-            
-            response_type = decision_data.get("type", "silent").lower()
-            priority = decision_data.get("priority", 0.0)
-            reasoning = decision_data.get("reasoning", "No reasoning provided")
-            
-            # Extract dialouge based on response type
-            if response_type == "speak":
-                dialogue = decision_data.get("dialogue", None) 
-                action = decision_data.get("action", None)  
-            elif response_type == "act":
-                dialogue = None  # No dialogue for silent action
-                action = decision_data.get("action", None)  
-            else:  # silent
-                dialogue = None
-                action = None
-            
-            return (
-                response_type,
-                priority,
-                reasoning,
-                dialogue,
-                action
-            )
+        # Generate with character's unique settings
+        response = self.model.generate_content(
+            prompt, 
+            system_prompt=_DECISION_INSTRUCTIONS,
+            temperature=character.persona.temperature, 
+            top_p=character.persona.top_p, 
+            frequency_penalty=character.persona.frequency_penalty
+        )
+        
+        return self._parse_turn_decision(response.text)
+    
+    async def decide_turn_response_async(
+        self, 
+        character: Character
+    ) -> Tuple[str, float, str, Optional[str], Optional[str]]:
+        """
+        Async version of decide_turn_response, so several characters can decide concurrently.
+        
+        Args:
+            character: The Character making the decision
             
-        except json.JSONDecodeError as e:
-            raise e
-        except Exception as e:
-            raise e
+        Returns:
+            Tuple of (response_type, priority, reasoning, dialouge, action)
+        """
+        prompt = self.build_decision_prompt(character)
+        
+        response = await self.model.generate_content_async(
+            prompt, 
+            system_prompt=_DECISION_INSTRUCTIONS,
+            temperature=character.persona.temperature, 
+            top_p=character.persona.top_p, 
+            frequency_penalty=character.persona.frequency_penalty
+        )
+        
+        return self._parse_turn_decision(response.text)
     
     def broadcast_event_to_characters(self, characters: List[Character], event: TimelineEvent) -> None:
         """
@@ -357,4 +397,17 @@ class CharacterManager:
             event: The event being broadcasted
         """
         for character in characters:
-            self.update_character_memory(character, event=event)
\ No newline at end of file
+            self.update_character_memory(character, event=event)
+
+    def broadcast_events_to_characters(self, characters: List[Character], events: List[TimelineEvent]) -> None:
+        """
+        Add several TimelineEvents, in order, to all characters' events in one pass.
+        
+        Args:
+            characters: List of all characters present
+            events: The events being broadcasted
+        """
+        if not events:
+            return
+        for character in characters:
+            self.update_character_memory(character, events=events)
\ No newline at end of file
@@ -60,31 +60,36 @@ class TimelineManager:
             event: TimelineEvent instance to add (Message or Scene)
         """
         timeline.events.append(event)
-        
-        # If it's a message, update participants
-        if isinstance(event, Message):
-            if event.character not in timeline.participants:
-                timeline.participants.append(event.character)
-            if event.character not in timeline.current_participants:
-                timeline.current_participants.append(event.character)
+        self._update_participants(timeline, event)
 
-        elif isinstance(event, Action):
-            if event.character not in timeline.participants:
-                timeline.participants.append(event.character)
-            if event.character not in timeline.current_participants:
-                timeline.current_participants.append(event.character)
+    def extend_events(
+        self,
+        timeline: TimelineHistory,
+        events: List[TimelineEvent]
+    ) -> None:
+        """
+        Add several events to the timeline at once, in order.
         
-        elif isinstance(event, CharacterEntry):
+        Args:
+            timeline: TimelineHistory instance to add events to
+            events: TimelineEvent instances to add
+        """
+        timeline.events.extend(events)
+        for event in events:
+            self._update_participants(timeline, event)
+
+    def _update_participants(self, timeline: TimelineHistory, event: TimelineEvent) -> None:
+        """Update the participant lists for an event that was just added to the timeline."""
+        # Messages, actions and entries/exits all involve a character; scenes don't
+        if isinstance(event, (Message, Action, CharacterEntry, CharacterExit)):
             if event.character not in timeline.participants:
                 timeline.participants.append(event.character)
-            if event.character not in timeline.current_participants:
+
+            if isinstance(event, CharacterExit):
+                if event.character in timeline.current_participants:
+                    timeline.current_participants.remove(event.character)
+            elif event.character not in timeline.current_participants:
                 timeline.current_participants.append(event.character)
-        
-        elif isinstance(event, CharacterExit):
-            if event.character not in timeline.participants:
-                timeline.participants.append(event.character)
-            if event.character in timeline.current_participants:
-                timeline.current_participants.remove(event.character)
 
     
     def get_recent_events(
@@ -5,9 +5,10 @@ All timeline operations are delegated to TimelineManager.
 """
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import random
 import time
-from typing import List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
 from colorama import Fore, Style
 
 from data_models import Message, TimelineHistory, Character, Scene, CharacterEntry, CharacterExit
@@ -60,52 +61,95 @@ class TurnManager:
         self.turn_count = 0
         self.consecutive_silence_rounds = 0
     
-    def _collect_speaking_decisions(self) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
+    def _tally_decisions(
+        self,
+        results: Iterable[Tuple[Character, Any]]
+    ) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
         """
-        Collect response decisions from all AI characters using parallel execution.
+        Report each character's decision and keep the ones that want to respond.
         
+        Args:
+            results: (character, decision_tuple or raised exception) pairs, in the order they finished
+            
         Returns:
             List of tuples containing (character, decision_tuple) for characters that want to respond (speak or act)
         """
         decisions = []
         quota_exceeded = False
         
-        # Define worker function for parallel execution
-        def get_character_decision(character):
-            return character, self.character_manager.decide_turn_response(
-                character
-            )
+        for character, result in results:
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.TimeoutError):
+                    print(f"⚠️Timed out waiting for decision from {character.persona.name}")
+                else:
+                    print(f"⚠️Error getting decision from {character.persona.name}: {result}")
+                continue
+            
+            response_type, priority, reasoning, dialogue, action = result
+            
+            # Check for quota exceeded error
+            if reasoning == "API_QUOTA_EXCEEDED":
+                quota_exceeded = True
+                continue
+            
+            if response_type in ["speak", "act"]:
+                decisions.append((character, (response_type, priority, reasoning, dialogue, action)))
+                emoji = "💭" if response_type == "speak" else "👤"
+                type_label = "Speech" if response_type == "speak" else "Action"
+                print(f"{emoji} {character.persona.name}: Priority {priority:.2f} ({type_label}) - {reasoning}")
+            else:
+                print(f"🤐 {character.persona.name}: {reasoning}")
+        
+        if quota_exceeded:
+            print("⚠️API QUOTA EXCEEDED")
         
+        return decisions
+    
+    def _collect_speaking_decisions(self) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
+        """
+        Collect response decisions from all AI characters using parallel execution.
+        
+        Returns:
+            List of tuples containing (character, decision_tuple) for characters that want to respond (speak or act)
+        """
         # Execute all character decisions in parallel
         with ThreadPoolExecutor(max_workers=len(self.characters)) as executor:
-            futures = {executor.submit(get_character_decision, char): char for char in self.characters}
+            futures = {
+                executor.submit(self.character_manager.decide_turn_response, char): char
+                for char in self.characters
+            }
             
             # Process results as they complete
-            for future in as_completed(futures):
-                try:
-                    character, (response_type, priority, reasoning, dialogue, action) = future.result()
-                    
-                    # Check for quota exceeded error
-                    if reasoning == "API_QUOTA_EXCEEDED":
-                        quota_exceeded = True
-                        continue
-                    
-                    if response_type in ["speak", "act"]:
-                        decisions.append((character, (response_type, priority, reasoning, dialogue, action)))
-                        emoji = "💭" if response_type == "speak" else "👤"
-                        type_label = "Speech" if response_type == "speak" else "Action"
-                        print(f"{emoji} {character.persona.name}: Priority {priority:.2f} ({type_label}) - {reasoning}")
-                    else:
-                        print(f"🤐 {character.persona.name}: {reasoning}")
-                        
-                except Exception as e:
-                    character = futures[future]
-                    print(f"⚠️Error getting decision from {character.persona.name}: {e}")
+            def completed():
+                for future in as_completed(futures):
+                    try:
+                        yield futures[future], future.result()
+                    except Exception as e:
+                        yield futures[future], e
+            
+            return self._tally_decisions(completed())
+    
+    async def _collect_speaking_decisions_async(self) -> List[Tuple[Character, Tuple[str, float, str, Optional[str], Optional[str]]]]:
+        """
+        Collect response decisions from all AI characters concurrently on the event loop.
+        Each character's call is bounded by Config.RESPONSE_TIMEOUT so one slow
+        character cannot stall the others; failed calls are reported and skipped.
         
-        if quota_exceeded:
-            print("⚠️API QUOTA EXCEEDED")
+        Returns:
+            List of tuples containing (character, decision_tuple) for characters that want to respond (speak or act)
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self.character_manager.decide_turn_response_async(char),
+                    timeout=Config.RESPONSE_TIMEOUT
+                )
+                for char in self.characters
+            ),
+            return_exceptions=True
+        )
         
-        return decisions
+        return self._tally_decisions(zip(self.characters, results))
     
     def _select_speaker_from_decisions(
         self, 
@@ -2,11 +2,46 @@
 OpenRouter API client wrapper.
 """
 
-from openai import OpenAI
-from typing import Optional
+from functools import lru_cache
+from openai import OpenAI, AsyncOpenAI
+from typing import Optional, Tuple
 from config import Config
 
 
+class Response:
+    """Generated content with a .text attribute"""
+    
+    def __init__(self, content):
+        self.text = content
+    
+    def __str__(self):
+        return self.text
+
+
+def _translate_error(e: Exception) -> Exception:
+    """Map provider errors to the messages callers look for (rate limit, bad key)."""
+    error_msg = str(e)
+    if "429" in error_msg or "rate" in error_msg.lower():
+        return Exception(f"ResourceExhausted: 429 Rate limit exceeded. {error_msg}")
+    elif "401" in error_msg or "invalid" in error_msg.lower():
+        return Exception(f"InvalidAPIKey: {error_msg}")
+    return e
+
+
+@lru_cache(maxsize=None)
+def _get_clients(api_key: str) -> Tuple[OpenAI, AsyncOpenAI]:
+    """
+    Return the (sync, async) OpenRouter clients for an API key.
+    
+    Clients are shared by every GenerativeModel so all managers reuse one
+    HTTP connection pool instead of each opening their own connections.
+    """
+    return (
+        OpenAI(base_url=Config.OPENROUTER_BASE_URL, api_key=api_key),
+        AsyncOpenAI(base_url=Config.OPENROUTER_BASE_URL, api_key=api_key),
+    )
+
+
 class GenerativeModel:
     """Model wrapper"""
     
@@ -27,9 +62,20 @@ class GenerativeModel:
                 "Please set it in your .env file or pass it to the constructor."
             )
         
-        self._client = OpenAI(
-            base_url=Config.OPENROUTER_BASE_URL,
-            api_key=self.api_key
+        self._client, self._async_client = _get_clients(self.api_key)
+    
+    def _request_params(self, prompt: str, kwargs: dict) -> dict:
+        """Build chat completion parameters from a prompt and generation settings."""
+        messages = [{"role": "user", "content": prompt}]
+        if kwargs.get('system_prompt'):
+            messages.insert(0, {"role": "system", "content": kwargs['system_prompt']})
+        return dict(
+            model=self.model_name,
+            messages=messages,
+            temperature=kwargs.get('temperature', Config.MODEL_TEMPERATURE),
+            max_tokens=kwargs.get('max_tokens', Config.MAX_TOKENS),
+            top_p=kwargs.get('top_p', 1.0),
+            frequency_penalty=kwargs.get('frequency_penalty', 0.0)
         )
     
     def generate_content(self, prompt: str, **kwargs):
@@ -38,42 +84,30 @@ class GenerativeModel:
         
         Args:
             prompt: The text prompt
-            **kwargs: Additional parameters (temperature, max_tokens, top_p, frequency_penalty, etc.)
+            **kwargs: Additional parameters (system_prompt, temperature, max_tokens, top_p, frequency_penalty, etc.)
             
         Returns:
             Response object with .text attribute
         """
         try:
-            temperature = kwargs.get('temperature', Config.MODEL_TEMPERATURE)
-            max_tokens = kwargs.get('max_tokens', Config.MAX_TOKENS)
-            top_p = kwargs.get('top_p', 1.0)
-            frequency_penalty = kwargs.get('frequency_penalty', 0.0)
-            
-            response = self._client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                frequency_penalty=frequency_penalty
-            )
-
-            class Response:
-                def __init__(self, content):
-                    self.text = content
-                def __str__(self):
-                    return self.text
-            
+            response = self._client.chat.completions.create(**self._request_params(prompt, kwargs))
             return Response(response.choices[0].message.content)
+        except Exception as e:
+            raise _translate_error(e)
+    
+    async def generate_content_async(self, prompt: str, **kwargs):
+        """
+        Generate content from prompt without blocking the event loop.
+        
+        Args:
+            prompt: The text prompt
+            **kwargs: Additional parameters (system_prompt, temperature, max_tokens, top_p, frequency_penalty, etc.)
             
+        Returns:
+            Response object with .text attribute
+        """
+        try:
+            response = await self._async_client.chat.completions.create(**self._request_params(prompt, kwargs))
+            return Response(response.choices[0].message.content)
         except Exception as e:
-
-            error_msg = str(e)
-            if "429" in error_msg or "rate" in error_msg.lower():
-                raise Exception(f"ResourceExhausted: 429 Rate limit exceeded. {error_msg}")
-            elif "401" in error_msg or "invalid" in error_msg.lower():
-                raise Exception(f"InvalidAPIKey: {error_msg}")
-            else:
-                raise
\ No newline at end of file
+            raise _translate_error(e)
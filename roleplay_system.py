@@ -2,15 +2,239 @@
 Main roleplay system coordinator.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set
 from pathlib import Path
+import atexit
+import os
+import queue
+import re
+import sys
+import threading
+import weakref
 from datetime import datetime
-import json
 
-from data_models import CharacterPersona, Character, TimelineHistory
+
+from data_models import (
+    CharacterPersona, Character, TimelineHistory,
+    Message, Scene, Action, CharacterEntry, CharacterExit
+)
 from managers.turn_manager import TurnManager
 from managers.timelineManager import TimelineManager
 from config import Config
+from helpers import json_codec
+
+
+# Conversation writes are serialized and written by one background thread so
+# saving never blocks the caller on disk I/O. Jobs are zero-argument callables.
+_save_queue: "queue.Queue" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+# Write buffer for the JSONL event log handle
+_EVENT_LOG_BUFFER_SIZE = 64 * 1024
+
+
+def _writer_loop() -> None:
+    """Run queued save jobs forever (daemon thread)."""
+    while True:
+        job = _save_queue.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"⚠️  Error saving conversation: {e}")
+        finally:
+            _save_queue.task_done()
+
+
+def _enqueue_save(job) -> None:
+    """Queue a save job, starting the writer thread on first use."""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="conversation-writer", daemon=True)
+            _writer_thread.start()
+    _save_queue.put_nowait(job)
+
+
+def flush_pending_saves() -> None:
+    """Block until every queued conversation write has reached disk."""
+    _save_queue.join()
+
+
+# Systems that may hold open conversation files. Weak references, so a replaced
+# system can still be garbage collected; whatever is left is closed at exit.
+_open_systems: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all_conversation_files() -> None:
+    """Close the conversation files of every live system (runs once at interpreter exit)."""
+    for system in list(_open_systems):
+        system.close()
+
+
+# Bracketed action in player input, e.g. "Hello [waves]"
+_BRACKET_RE = re.compile(r'\[([^\]]+)\]')
+
+# Player commands (matched case-insensitively)
+_EXIT_CMDS = frozenset({'quit', 'exit', 'end', 'goodbye'})
+_INFO_CMDS = frozenset({'info', 'characters', 'help'})
+
+# Welcome banner; the player and character names are filled in once per session
+_WELCOME_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                                                                      ║
+║                      🎭 ROLEREALM SYSTEM 🎭                         ║
+║                                                                      ║
+║                  Interactive AI-Powered Roleplay                     ║
+║                                                                      ║
+╚══════════════════════════════════════════════════════════════════════╝
+
+You are playing as {player_upper}, joined by {char_names}.
+
+The conversation will flow naturally - AI characters will respond when they
+have something to say, creating an organic, dynamic storytelling experience!
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📜 COMMANDS:
+   • Just type naturally to speak as {player_name}
+   • 'skip' - Let AI characters continue talking without you
+   • 'info' - See character details
+   • 'quit' or 'exit' - End the roleplay session
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+# Shown after reset_conversation clears the saved chat
+_RESET_BANNER = "\n".join([
+    "\n" + "="*70,
+    "🔄 CONVERSATION RESET",
+    "="*70,
+    "All previous events have been cleared.",
+    "Starting fresh conversation...",
+    "="*70 + "\n"
+]) + "\n"
+
+# Top-level scalar fields of a saved TimelineHistory restored on load
+_TIMELINE_SCALAR_KEYS = ('id', 'title', 'timeline_summary', 'visible_to_user')
+
+
+def _build_event(event_data: dict):
+    """
+    Rebuild a timeline event from its saved dictionary form.
+    
+    Args:
+        event_data: Serialized event as written by _save_conversation
+        
+    Returns:
+        The matching TimelineEvent subclass instance, or None if unrecognized
+    """
+    # Saved files are written by _save_conversation, so events are rebuilt with
+    # model_construct to skip re-validating every field on load
+    common = {
+        'timestamp': datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now()
+    }
+    if 'timeline_id' in event_data:
+        common['timeline_id'] = event_data['timeline_id']
+    
+    # Check for explicit type field first (new format), then fall back to field sniffing
+    event_type = event_data.get('type')
+    if event_type is None:
+        if 'character' in event_data and 'dialouge' in event_data:
+            event_type = 'message'
+        elif 'location' in event_data and 'description' in event_data:
+            event_type = 'scene'
+        elif 'character' in event_data and 'description' in event_data:
+            event_type = 'action'
+    
+    if event_type == 'message':
+        return Message.model_construct(
+            **common,
+            character=event_data['character'],
+            dialouge=event_data['dialouge'],
+            action_description=event_data['action_description']
+        )
+    elif event_type == 'scene':
+        return Scene.model_construct(
+            **common,
+            scene_type=event_data.get('scene_type', 'environmental'),
+            location=event_data['location'],
+            description=event_data['description']
+        )
+    elif event_type == 'action':
+        return Action.model_construct(
+            **common,
+            character=event_data['character'],
+            description=event_data['description']
+        )
+    elif event_type == 'character_entry':
+        return CharacterEntry.model_construct(
+            **common,
+            character=event_data['character'],
+            description=event_data['description']
+        )
+    elif event_type == 'character_exit':
+        return CharacterExit.model_construct(
+            **common,
+            character=event_data['character'],
+            description=event_data['description']
+        )
+    return None
+
+
+def _serialize_event(event) -> Optional[dict]:
+    """
+    Convert a timeline event into its saved dictionary form.
+    
+    Args:
+        event: TimelineEvent instance to serialize
+        
+    Returns:
+        Dictionary with an explicit 'type' field, or None for unknown event types
+    """
+    if isinstance(event, Message):
+        return {
+            "type": "message",
+            "timeline_id": event.timeline_id,
+            "timestamp": event.timestamp,
+            "character": event.character,
+            "dialouge": event.dialouge,
+            "action_description": event.action_description
+        }
+    elif isinstance(event, Scene):
+        return {
+            "type": "scene",
+            "timeline_id": event.timeline_id,
+            "timestamp": event.timestamp,
+            "location": event.location,
+            "description": event.description
+        }
+    elif isinstance(event, Action):
+        return {
+            "type": "action",
+            "timeline_id": event.timeline_id,
+            "timestamp": event.timestamp,
+            "character": event.character,
+            "description": event.description
+        }
+    elif isinstance(event, CharacterEntry):
+        return {
+            "type": "character_entry",
+            "timeline_id": event.timeline_id,
+            "timestamp": event.timestamp,
+            "character": event.character,
+            "description": event.description
+        }
+    elif isinstance(event, CharacterExit):
+        return {
+            "type": "character_exit",
+            "timeline_id": event.timeline_id,
+            "timestamp": event.timestamp,
+            "character": event.character,
+            "description": event.description
+        }
+    return None
 
 
 class RoleplaySystem:
@@ -25,7 +249,9 @@ class RoleplaySystem:
         story_manager = None,
         story_name: str = "default",
         initial_location: str = "Common Room",
-        initial_scene_description: str = None
+        initial_scene_description: str = None,
+        verbose: bool = True,
+        resume: bool = True
     ):
         """
         Initialize the roleplay system.
@@ -39,6 +265,9 @@ class RoleplaySystem:
             story_name: Name of the story (used for unique conversation filenames)
             initial_location: Starting location for the conversation
             initial_scene_description: Optional initial scene description
+            verbose: Whether to print welcome, load and reset notices (disable for batch runs)
+            resume: Whether to continue the saved conversation for this story, if there is one
+                    (when False, the first save replaces it)
             
         Raises:
             ValueError: If OPENROUTER_API_KEY is not set
@@ -52,6 +281,7 @@ class RoleplaySystem:
             )
         
         self.player_name = player_name
+        self._verbose = verbose
         self.model_name = model_name or Config.DEFAULT_MODEL
         self.story_name = story_name
         
@@ -64,6 +294,28 @@ class RoleplaySystem:
             temp_character_manager.create_character(persona=persona)
             for persona in characters
         ]
+        self._char_by_name = {char.persona.name: char for char in self.ai_characters}
+        # Lowercased name lookup for spotting characters mentioned in player input
+        self.char_by_lname = {name.lower(): char for name, char in self._char_by_name.items()}
+        # Whole names only (longest first), so "Old Sailor" matches but "martinez" does not mention Martin
+        self._mention_re = re.compile(
+            r'(?<!\w)(?:' + '|'.join(map(re.escape, sorted(self.char_by_lname, key=len, reverse=True))) + r')(?!\w)'
+        ) if self.char_by_lname else None
+
+        # Character rosters never change during a session, so render their display text once
+        self._char_names_joined = ", ".join(self._char_by_name)
+        info_lines = ["\n📖 CHARACTER INFORMATION:\n"]
+        for persona in characters:
+            info_lines.append(f"🎭 {persona.name}")
+            info_lines.append(f"   Traits: {', '.join(persona.traits[:3])}...")
+            info_lines.append(f"   Style: {persona.speaking_style[:60]}...")
+            info_lines.append("")
+        self._char_info_text = "\n".join(info_lines) + "\n"
+        self._welcome_banner = _WELCOME_TEMPLATE.format(
+            player_upper=player_name.upper(),
+            player_name=player_name,
+            char_names=self._char_names_joined
+        ) + "\n"
         
         # Create timeline manager
         temp_timeline_manager = TimelineManager()
@@ -102,124 +354,121 @@ class RoleplaySystem:
         # Setup storage
         self.chat_storage_dir = Path(chat_storage_dir or Config.CHAT_STORAGE_DIR)
         self.chat_storage_dir.mkdir(exist_ok=True)
+        # Use story name to create unique conversation files (snapshot + event log)
+        safe_story_name = self.story_name.lower().replace(" ", "_")
+        self._conversation_path = self.chat_storage_dir / f"{safe_story_name}_chat.json"
+        self._event_log_path = self._conversation_path.with_suffix(".jsonl")
+        
+        # The event log handle is opened on first save and kept for the whole session
+        self._events_fp = None
+        self._last_saved_event_idx = 0
+        self._log_event_count = 0
+        self._needs_snapshot = True
+        _open_systems.add(self)
         
         # Try to load existing conversation
-        self._load_conversation_if_exists()
+        if resume:
+            self._load_conversation_if_exists()
     
     def _load_conversation_if_exists(self) -> bool:
         """
         Load existing conversation from file if it exists.
         
+        Restores the last full snapshot, then replays any events appended to
+        the JSONL event log since that snapshot was written.
+        
         Returns:
             True if conversation was loaded, False otherwise
         """
-        filepath = self.get_conversation_file_path()
+        filepath = self._conversation_path
+        log_path = self._event_log_path
         
-        if not filepath.exists():
+        if not filepath.exists() and not log_path.exists():
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Restore timeline from saved data
-            from data_models import Message, Scene
+            restored = []
+            if filepath.exists():
+                try:
+                    # Memory-map the snapshot so it is parsed in place rather than copied into a string first
+                    data = json_codec.load_file(filepath)
+                except (OSError, ValueError) as e:
+                    # A torn snapshot must not cost the events still readable from the log
+                    print(f"\n⚠️  Could not read conversation snapshot {filepath}: {e}")
+                    data = None
+                
+                if data is not None:
+                    for key in _TIMELINE_SCALAR_KEYS:
+                        if data.get(key) is not None:
+                            setattr(self.timeline, key, data[key])
+                    # Keep everyone in the current game and add anyone else the saved session had seen
+                    participants = self.timeline.participants
+                    participants.extend(
+                        name for name in dict.fromkeys(data.get('participants') or [])
+                        if name not in participants
+                    )
+                    
+                    # Restore events (messages, scenes, actions, entries and exits)
+                    restored = [_build_event(event_data) for event_data in data.get('events', [])]
+                    restored = [event for event in restored if event is not None]
             
-            # Clear current timeline events
-            self.timeline.events.clear()
+            # Replay events logged after the snapshot, one JSON object per line. Events already
+            # in the snapshot are skipped in case a compaction was interrupted before truncating the log.
+            logged = []
+            if log_path.exists():
+                snapshot_ids = {event.timeline_id for event in restored}
+                with open(log_path, 'rb') as f:
+                    for line in f:
+                        try:
+                            event = _build_event(json_codec.loads(line))
+                        except json_codec.JSONDecodeError:
+                            continue  # Torn final line from an interrupted write
+                        if event is not None and event.timeline_id not in snapshot_ids:
+                            logged.append(event)
             
-            # Restore timeline metadata
-            if 'id' in data:
-                self.timeline.id = data['id']
-            if 'title' in data:
-                self.timeline.title = data['title']
-            if 'participants' in data:
-                self.timeline.participants = data['participants']
-            if 'timeline_summary' in data:
-                self.timeline.timeline_summary = data['timeline_summary']
-            if 'visible_to_user' in data:
-                self.timeline.visible_to_user = data['visible_to_user']
+            if not restored and not logged:
+                # Nothing readable was saved; keep the fresh timeline with its initial scene
+                return False
             
-            # Restore events (messages, scenes, and actions)
-            for event_data in data.get('events', []):
-                # Check for explicit type field first (new format)
-                event_type = event_data.get('type')
-                
-                if event_type == 'message' or ('character' in event_data and 'dialouge' in event_data):
-                    # This is a Message
-                    message = Message(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        dialouge=event_data['dialouge'],
-                        action_description=event_data['action_description']
-                    )
-                    self.timeline.events.append(message)
-                elif event_type == 'scene' or ('location' in event_data and 'description' in event_data):
-                    # This is a Scene
-                    scene = Scene(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        scene_type=event_data.get('scene_type', 'environmental'),
-                        location=event_data['location'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(scene)
-                elif event_type == 'action' or ('character' in event_data and 'description' in event_data):
-                    # This is an Action
-                    from data_models import Action
-                    action = Action(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(action)
-                elif event_type == 'character_entry':
-                    # This is a CharacterEntry
-                    from data_models import CharacterEntry
-                    entry = CharacterEntry(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description']
-                    )
-                    self.timeline.events.append(entry)
-                elif event_type == 'character_exit':
-                    # This is a CharacterExit
-                    from data_models import CharacterExit
-                    exit_event = CharacterExit(
-                        timeline_id=event_data.get('timeline_id'),
-                        timestamp=datetime.fromisoformat(event_data['timestamp']) if 'timestamp' in event_data else datetime.now(),
-                        character=event_data['character'],
-                        description=event_data['description'],
-                        reason=event_data.get('reason')
-                    )
-                    self.timeline.events.append(exit_event)
+            # Only replace the fresh timeline once the saved events are in hand. Without a
+            # snapshot the initial scene is kept, and the first save writes the logged events
+            # into a new snapshot before the log is truncated.
+            if restored:
+                self.timeline.events.clear()
+            self.timeline.events.extend(restored)
+            self.timeline.events.extend(logged)
+            self._last_saved_event_idx = len(self.timeline.events)
+            self._log_event_count = len(logged)
             
             # Broadcast all events to characters so they have the full context
-            # Replay timeline to track who was present at each point
-            present_at_moment = set(self.timeline.participants)  # Start with all initial participants
+            # Replay timeline to track who was present at each point, starting with all initial participants
+            initial_participants = set(self.timeline.participants)
+            active_characters = [c for c in self.ai_characters if c.persona.name in initial_participants]
             
             for event in self.timeline.events:
                 # Broadcast to whoever was present at this moment
-                active_characters = [c for c in self.ai_characters if c.persona.name in present_at_moment]
                 self.character_manager.broadcast_event_to_characters(active_characters, event)
                 
-                # Update presence based on Entry/Exit events
-                from data_models import CharacterEntry, CharacterExit
+                # Update presence only on Entry/Exit events
                 if isinstance(event, CharacterEntry):
-                    present_at_moment.add(event.character)
+                    character = self._char_by_name.get(event.character)
+                    if character and character not in active_characters:
+                        active_characters.append(character)
                 elif isinstance(event, CharacterExit):
-                    present_at_moment.discard(event.character)
+                    character = self._char_by_name.get(event.character)
+                    if character in active_characters:
+                        active_characters.remove(character)
             
-            print("\n" + "="*70)
-            print("📂 LOADED EXISTING CONVERSATION")
-            print("="*70)
-            print(f"Restored {len(self.timeline.events)} events from previous session")
-            print(f"Participants: {', '.join(self.timeline.participants)}")
-            print(f"Continuing from where you left off...")
-            print("="*70 + "\n")
+            if self._verbose:
+                sys.stdout.write("\n".join([
+                    "\n" + "="*70,
+                    "📂 LOADED EXISTING CONVERSATION",
+                    "="*70,
+                    f"Restored {len(self.timeline.events)} events from previous session",
+                    f"Participants: {', '.join(self.timeline.participants)}",
+                    "Continuing from where you left off...",
+                    "="*70 + "\n"
+                ]) + "\n")
             
             return True
             
@@ -229,92 +478,98 @@ class RoleplaySystem:
             return False
     
     def _save_conversation(self) -> None:
-        """Save the current conversation to a JSON file in TimelineHistory format."""
-        filename = "group_chat.json"
-        filepath = self.chat_storage_dir / filename
+        """
+        Save new timeline events since the last save.
         
+        Events are appended to a JSONL event log, so each save costs O(new events).
+        On the first save of a session and every Config.CHAT_COMPACT_EVERY logged
+        events, the full timeline is written as a TimelineHistory snapshot and the
+        log is truncated. Only the bookkeeping happens here; serialization and disk
+        writes are handed to the background writer thread.
+        """
         try:
-            from data_models import Message, Scene, Action
+            events = self.timeline.events
             
-            # Manually construct the data structure to ensure proper serialization
-            timeline_data = {
-                "id": self.timeline.id,
-                "title": self.timeline.title,
-                "events": [],
-                "participants": self.timeline.participants,
-                "timeline_summary": self.timeline.timeline_summary,
-                "visible_to_user": self.timeline.visible_to_user
-            }
+            # Events were removed since the last save; only a full snapshot is consistent now
+            if self._last_saved_event_idx > len(events):
+                self._last_saved_event_idx = 0
+                self._needs_snapshot = True
             
-            # Serialize each event with all its fields
-            for event in self.timeline.events:
-                if isinstance(event, Message):
-                    event_data = {
-                        "type": "message",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "dialouge": event.dialouge,
-                        "action_description": event.action_description
-                    }
-                elif isinstance(event, Scene):
-                    event_data = {
-                        "type": "scene",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "location": event.location,
-                        "description": event.description
-                    }
-                elif isinstance(event, Action):
-                    event_data = {
-                        "type": "action",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description
-                    }
-                elif isinstance(event, CharacterEntry):
-                    from data_models import CharacterEntry
-                    event_data = {
-                        "type": "character_entry",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description
-                    }
-                elif isinstance(event, CharacterExit):
-                    from data_models import CharacterExit
-                    event_data = {
-                        "type": "character_exit",
-                        "timeline_id": event.timeline_id,
-                        "timestamp": event.timestamp.isoformat(),
-                        "character": event.character,
-                        "description": event.description,
-                        "reason": event.reason if hasattr(event, 'reason') else None
-                    }
-                else:
-                    continue
-                
-                timeline_data["events"].append(event_data)
+            new_events = events[self._last_saved_event_idx:]
+            
+            if self._needs_snapshot or self._log_event_count + len(new_events) >= Config.CHAT_COMPACT_EVERY:
+                # Manually construct the data structure to ensure proper serialization
+                timeline_data = {
+                    "id": self.timeline.id,
+                    "title": self.timeline.title,
+                    "events": [data for data in map(_serialize_event, events) if data is not None],
+                    "participants": list(self.timeline.participants),
+                    "timeline_summary": self.timeline.timeline_summary,
+                    "visible_to_user": self.timeline.visible_to_user
+                }
+                _enqueue_save(lambda: self._write_snapshot(timeline_data))
+                self._needs_snapshot = False
+                self._log_event_count = 0
+            elif new_events:
+                event_data = [data for data in map(_serialize_event, new_events) if data is not None]
+                _enqueue_save(lambda: self._append_to_event_log(event_data))
+                self._log_event_count += len(new_events)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(timeline_data, f, indent=2, ensure_ascii=False)
+            self._last_saved_event_idx = len(events)
                 
         except Exception as e:
             print(f"⚠️  Error saving conversation: {e}")
     
+    def _write_snapshot(self, timeline_data: dict) -> None:
+        """Rewrite the full conversation snapshot and truncate the event log (writer thread)."""
+        # Write a temp file and swap it in, so a crash mid-write never leaves a torn snapshot
+        tmp_path = self._conversation_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as fp:
+            # Datetimes are serialized natively as ISO 8601 (readable by datetime.fromisoformat)
+            fp.write(json_codec.dumps(timeline_data, indent=True))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, self._conversation_path)
+        
+        # Everything logged so far is now in the snapshot
+        if self._events_fp is None:
+            self._events_fp = open(self._event_log_path, 'ab', buffering=_EVENT_LOG_BUFFER_SIZE)
+        self._events_fp.truncate(0)
+    
+    def _append_to_event_log(self, event_data: List[dict]) -> None:
+        """Append serialized events to the JSONL event log, one compact JSON object per line (writer thread)."""
+        if self._events_fp is None:
+            self._events_fp = open(self._event_log_path, 'ab', buffering=_EVENT_LOG_BUFFER_SIZE)
+        write = self._events_fp.write
+        for data in event_data:
+            write(json_codec.dumps_line(data))
+        # Let the buffer absorb bursts of appends; flush once the writer has caught up
+        if _save_queue.empty():
+            self._events_fp.flush()
+    
+    def close(self) -> None:
+        """
+        Finish pending writes, then close the event log handle if it is open.
+        
+        Call this before replacing the system with a new one for the same conversation,
+        so buffered log lines reach disk before the new system takes over the files.
+        """
+        flush_pending_saves()
+        if self._events_fp is not None:
+            self._events_fp.close()
+            self._events_fp = None
+    
     def _add_player_message(self, content: str) -> None:
         """Add a player message to the conversation."""
         # Extract action description from brackets if present
-        import re
         action_desc = None
         dialogue = content
         
-        bracket_match = re.search(r'\[([^\]]+)\]', content)
+        bracket_match = _BRACKET_RE.search(content)
         if bracket_match:
             action_desc = bracket_match.group(1).strip()
             # Remove brackets from the dialogue
-            dialogue = re.sub(r'\[([^\]]+)\]', '', content).strip()
+            dialogue = _BRACKET_RE.sub('', content).strip()
         
         # If no action description found in brackets, set a default
         if not action_desc:
@@ -333,72 +588,58 @@ class RoleplaySystem:
         self.character_manager.broadcast_event_to_characters(active_characters, message)
         self._save_conversation()
     
+    def find_mentioned_names(self, text: str) -> Set[str]:
+        """
+        Find the AI characters mentioned by name in a piece of text.
+        
+        Args:
+            text: Text to search, e.g. the player's input
+            
+        Returns:
+            Lowercased names of the mentioned characters
+        """
+        if self._mention_re is None:
+            return set()
+        return set(self._mention_re.findall(text.lower()))
+    
     def get_conversation_file_path(self) -> Path:
         """Get the file path where the conversation is saved."""
-        # Use story name to create unique conversation file
-        safe_story_name = self.story_name.lower().replace(" ", "_")
-        return self.chat_storage_dir / f"{safe_story_name}_chat.json"
+        return self._conversation_path
     
     def reset_conversation(self) -> None:
         """
         Reset the conversation to start fresh.
         Deletes the saved file and clears current messages.
         """
-        filepath = self.get_conversation_file_path()
+        filepath = self._conversation_path
         
-        # Delete saved file if it exists
-        if filepath.exists():
-            filepath.unlink()
+        # Close the event log handle so the next save starts new files
+        self.close()
+        
+        # Delete saved snapshot and event log if they exist
+        for path in (filepath, self._event_log_path):
+            if path.exists():
+                path.unlink()
         
         # Clear current timeline events
         self.timeline.events.clear()
+        self._last_saved_event_idx = 0
+        self._log_event_count = 0
+        self._needs_snapshot = True
         
-        print("\n" + "="*70)
-        print("🔄 CONVERSATION RESET")
-        print("="*70)
-        print("All previous events have been cleared.")
-        print("Starting fresh conversation...")
-        print("="*70 + "\n")
+        if self._verbose:
+            sys.stdout.write(_RESET_BANNER)
     
     def display_welcome(self) -> None:
         """Display welcome message with character information."""
-        char_names = ", ".join([char.persona.name for char in self.ai_characters])
-        
-        welcome = f"""
-╔══════════════════════════════════════════════════════════════════════╗
-║                                                                      ║
-║                      🎭 ROLEREALM SYSTEM 🎭                         ║
-║                                                                      ║
-║                  Interactive AI-Powered Roleplay                     ║
-║                                                                      ║
-╚══════════════════════════════════════════════════════════════════════╝
-
-You are playing as {self.player_name.upper()}, joined by {char_names}.
-
-The conversation will flow naturally - AI characters will respond when they
-have something to say, creating an organic, dynamic storytelling experience!
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📜 COMMANDS:
-   • Just type naturally to speak as {self.player_name}
-   • 'skip' - Let AI characters continue talking without you
-   • 'info' - See character details
-   • 'quit' or 'exit' - End the roleplay session
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        print(welcome)
+        if not self._verbose:
+            return
+        sys.stdout.write(self._welcome_banner)
     
     def display_character_info(self) -> None:
         """Display information about all AI characters."""
-        print("\n📖 CHARACTER INFORMATION:\n")
-        for character in self.ai_characters:
-            persona = character.persona
-            print(f"🎭 {persona.name}")
-            print(f"   Traits: {', '.join(persona.traits[:3])}...")
-            print(f"   Style: {persona.speaking_style[:60]}...")
-            print()
+        # Explicitly requested by the player, so this is not gated on verbosity
+        sys.stdout.write(self._char_info_text)
     
     def _send_initial_greeting(self) -> None:
         """Send initial greeting message from player."""
@@ -408,6 +649,30 @@ have something to say, creating an organic, dynamic storytelling experience!
         # Let AI characters respond (messages are printed inside process_ai_responses)
         ai_responses = self.turn_manager.process_ai_responses()
     
+    def _cmd_exit(self) -> bool:
+        """End the roleplay session."""
+        print("\n👋 Ending roleplay session...")
+        print(f"💾 Chat saved to: {self.get_conversation_file_path()}")
+        return False
+    
+    def _cmd_skip(self) -> bool:
+        """Let AI characters continue talking without the player."""
+        print("\n⏭️  Letting AI characters continue...")
+        ai_responses = self.turn_manager.process_ai_responses(max_turns=5)
+        return True
+    
+    def _cmd_info(self) -> bool:
+        """Show character details."""
+        self.display_character_info()
+        return True
+    
+    # Player commands mapped to their handlers
+    _COMMANDS = {
+        **dict.fromkeys(_EXIT_CMDS, _cmd_exit),
+        'skip': _cmd_skip,
+        **dict.fromkeys(_INFO_CMDS, _cmd_info),
+    }
+    
     def _handle_player_input(self, user_input: str) -> bool:
         """
         Handle player input and return whether to continue.
@@ -418,22 +683,10 @@ have something to say, creating an organic, dynamic storytelling experience!
         Returns:
             True to continue the conversation, False to exit
         """
-        # Check for exit commands
-        if user_input.lower() in ['quit', 'exit', 'end', 'goodbye']:
-            print("\n👋 Ending roleplay session...")
-            print(f"💾 Chat saved to: {self.get_conversation_file_path()}")
-            return False
-        
-        # Check for skip command
-        if user_input.lower() == 'skip':
-            print("\n⏭️  Letting AI characters continue...")
-            ai_responses = self.turn_manager.process_ai_responses(max_turns=5)
-            return True
-        
-        # Check for info command
-        if user_input.lower() in ['info', 'characters', 'help']:
-            self.display_character_info()
-            return True
+        # Dispatch commands (quit, skip, info, ...)
+        handler = self._COMMANDS.get(user_input.casefold())
+        if handler:
+            return handler(self)
         
         # Skip empty inputs
         if not user_input:
@@ -1,16 +1,29 @@
 
 import os
+import re
+from contextlib import asynccontextmanager
 from typing import List, Optional
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-from roleplay_system import RoleplaySystem
+from roleplay_system import RoleplaySystem, flush_pending_saves
 from loaders.character_loader import CharacterLoader
-from loaders.story_loader import StoryLoader
+from loaders.story_loader import get_story_loader, preload
 from managers.storyManager import StoryManager
 from config import Config
 
-app = FastAPI(title="Metavern API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse the default story in the background so the first /api/init is served from the cache
+    preload([InitRequest.model_fields["story_dir"].default])
+    yield
+    # Conversation writes happen on a background thread; let them finish before exit
+    flush_pending_saves()
+
+app = FastAPI(title="Metavern API", lifespan=lifespan)
+
+# Anything but letters, digits, '-' and spaces is replaced in conversation file names
+_UNSAFE_NAME_RE = re.compile(r'[^\w\- ]+')
 
 # Enable CORS
 app.add_middleware(
@@ -38,35 +51,46 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     messages: List[dict]
 
+def _conversation_name(story_dir: str, player_name: str) -> str:
+    """Name the saved conversation after the story and player, keeping only filename-safe characters."""
+    return _UNSAFE_NAME_RE.sub("_", f"{os.path.basename(os.path.normpath(story_dir))} {player_name}")
+
 @app.post("/api/init")
 async def init_game(request: InitRequest):
     try:
         # Load story
-        story_loader = StoryLoader(request.story_dir)
         story_arc = None
         try:
-            story_arc = story_loader.load_story()
+            story_arc = get_story_loader(request.story_dir).load_story()
         except Exception as e:
             print(f"Warning: Could not load story: {e}")
 
         # Load characters
-        character_loader = CharacterLoader(request.story_dir)
-        characters = character_loader.load_multiple_characters(request.characters)
+        characters = CharacterLoader(request.story_dir).load_multiple_characters(request.characters)
 
-        # Initialize System
+        # Release the previous game's save files before a new system takes them over
+        if game_state.system is not None:
+            game_state.system.close()
+            game_state.system = None
+
+        # Initialize System. Every web game starts fresh (the frontend has no way to resume one);
+        # turns are saved to a conversation of its own per story and player
         game_state.system = RoleplaySystem(
             player_name=request.player_name,
             characters=characters,
+            chat_storage_dir=Config.CHAT_STORAGE_DIR,
+            story_name=_conversation_name(request.story_dir, request.player_name),
             story_manager=StoryManager(story_arc) if story_arc else None,
             initial_location="Aboard the Sea Serpent",
-            initial_scene_description="The sun is setting over the endless ocean..."
+            initial_scene_description="The sun is setting over the endless ocean...",
+            resume=False
         )
         
         return {"status": "initialized", "message": "Game started successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-from data_models import Message, Action
+from data_models import Message, Action, Scene
 
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
@@ -84,31 +108,22 @@ async def chat(request: ChatRequest):
     )
     system.timeline_manager.add_event(system.timeline, user_message)
     
-    # 2. Check for DM Mention (@Martin)
-    # If explicitly mentioned, prioritize Martin
-    force_martin = "martin" in user_input.lower()
-    
-    responses = []
-    
-    if force_martin:
-        # Find Martin
-        martin = next((c for c in system.ai_characters if c.persona.name.lower() == "martin"), None)
-        if martin:
-             # Force a turn for Martin
-             pass
+    # 2. Check for character mentions (e.g. "Martin, what do you think?")
+    # Mentioned characters get their priority boosted
+    mentioned = system.find_mentioned_names(user_input)
 
     # 3. Let TurnManager handle AI responses
     turn_manager = system.turn_manager
     
     # Collect decisions
     try:
-        decisions = turn_manager._collect_speaking_decisions()
+        decisions = await turn_manager._collect_speaking_decisions_async()
         
         # Boost mentioned character priority
-        if force_martin:
+        if mentioned:
              for i, (char, decision) in enumerate(decisions):
-                 if char.persona.name.lower() == "martin":
-                     # Boost priority by adding 1.0 (ensures he's likely top)
+                 if char.persona.name.lower() in mentioned:
+                     # Boost priority by adding 2.0 (ensures they're likely top)
                      resp_type, prio, reas, dial, act = decision
                      decisions[i] = (char, (resp_type, prio + 2.0, reas, dial, act))
                      
@@ -118,10 +133,10 @@ async def chat(request: ChatRequest):
         print(f"Error collecting decisions: {e}")
         decisions = []
     
-    new_messages = []
-    
     # Allow multiple characters to speak (up to 3)
     count = 0
+    new_events = []
+    new_messages = []
     for character, (response_type, priority, reasoning, dialogue, action) in decisions:
         if count >= 3: 
             break
@@ -132,8 +147,9 @@ async def chat(request: ChatRequest):
                 dialouge=dialogue,
                 action_description=action or ""
             )
-            system.timeline_manager.add_event(system.timeline, msg)
-            
+            new_events.append(msg)
+            count += 1
+
             new_messages.append({
                 "character": character.persona.name,
                 "content": dialogue,
@@ -141,60 +157,68 @@ async def chat(request: ChatRequest):
                 "type": "message"
             })
             
-            # Update memory
-            system.character_manager.broadcast_event_to_characters(system.ai_characters, msg)
-            count += 1
-            
         elif response_type == "act":
             act_event = Action(
                 character=character.persona.name,
                 description=action
             )
-            system.timeline_manager.add_event(system.timeline, act_event)
+            new_events.append(act_event)
+            count += 1
 
             new_messages.append({
                 "character": character.persona.name,
                 "content": action, # For acts, content is description
                 "type": "action"
             })
-            system.character_manager.broadcast_event_to_characters(system.ai_characters, act_event)
-            count += 1
+
+    # Record this turn's events on the timeline and in every character's memory in one pass
+    system.timeline_manager.extend_events(system.timeline, new_events)
+    system.character_manager.broadcast_events_to_characters(system.ai_characters, new_events)
+
+    # Queue this turn's events for the background writer (appends only the new ones to the event log)
+    system._save_conversation()
 
     return {"messages": new_messages}
 
+# Converters from timeline events to the simple history format, keyed by event class
+_HISTORY_BUILDERS = {
+    Message: lambda event: {
+        "character": event.character,
+        "content": event.dialouge,
+        "action": event.action_description,
+        "type": "message",
+        "timestamp": event.iso_timestamp
+    },
+    Action: lambda event: {
+        "character": event.character,
+        "content": event.description,
+        "type": "action",
+        "timestamp": event.iso_timestamp
+    },
+    Scene: lambda event: {
+        "character": "System",
+        "content": f"[{event.location}] {event.description}",
+        "type": "scene",
+        "timestamp": event.iso_timestamp
+    },
+}
+
 @app.get("/api/history")
 async def get_history():
     if not game_state.system:
         return {"messages": []}
     
     # Convert timeline events to simple format
-    history = []
-    for event in game_state.system.timeline.events:
-        if event.type == "message":
-            history.append({
-                "character": event.character,
-                "content": event.dialouge,
-                "action": event.action_description,
-                "type": "message",
-                "timestamp": event.timestamp.isoformat()
-            })
-        elif event.type == "action":
-            history.append({
-                "character": event.character,
-                "content": event.description,
-                "type": "action",
-                "timestamp": event.timestamp.isoformat()
-            })
-        elif event.type == "scene":
-             history.append({
-                "character": "System",
-                "content": f"[{event.location}] {event.description}",
-                "type": "scene",
-                "timestamp": event.timestamp.isoformat()
-            })
+    builders = _HISTORY_BUILDERS
+    history = [
+        builders[type(event)](event)
+        for event in game_state.system.timeline.events
+        if type(event) in builders
+    ]
             
     return {"messages": history}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] provides uvloop and httptools, which "auto" picks up when installed
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto", log_level="warning")